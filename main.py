@@ -27,39 +27,204 @@ class StationDoesNotExistError(Exception):
         super().__init__(self.message)
 
 
+def _route_shift(n: int) -> int:
+    # Route costs pack the distance and number of routes taken into one int,
+    # (distance << shift) | routes, so comparing costs prefers the shorter distance and breaks
+    # ties on the fewest stops. Heap entries pack the cost and station id the same way,
+    # (cost << shift) | id, so they compare as plain ints without allocating tuples. The shift
+    # leaves room for a station id or the routes of two joined searches.
+    return (2 * n).bit_length()
+
+
+def _dijkstra(
+    routes: list[dict[int, int]], src: int
+) -> Tuple[list[int | None], list[int]]:
+    """Runs Dijkstra's algorithm over a station map.
+
+    routes[i] holds the distance of each route leaving station i keyed by destination id.
+    When routes tie on distance the one with the fewest stops is used.
+
+    Returns:
+        A tuple of the distance to each station from src and the number of routes taken to get there.
+
+        Stations that cannot be reached have a distance of None.
+    """
+    # Stations can be pushed more than once, outdated entries are skipped when popped rather
+    # than tracking visited stations separately. This also means we cant add all stations to
+    # unvisited stations at the start in order to support unconnected stations.
+    n = len(routes)
+    unvisited_stations: list[int] = []
+    shift = _route_shift(n)
+    mask = (1 << shift) - 1
+    # Unvisited stations start out of reach. None is used rather than a large number so that
+    # no real route can be mistaken for it and arithmetic stays in ints.
+    cost: list[int | None] = [None] * n
+
+    # heapq is implemented in C, binding it locally keeps global lookups out of the loop.
+    push, pop = heappush, heappop
+
+    cost[src] = 0
+    push(unvisited_stations, src)  # start at the origin station with distance 0
+
+    while len(unvisited_stations) > 0:
+        entry = pop(unvisited_stations)  # pop off the nearest unvisited station
+        current_cost, current_station = entry >> shift, entry & mask
+
+        if current_cost != cost[current_station]:
+            continue  # a shorter route to this station has already been processed.
+
+        for connected_station, distance in routes[current_station].items():
+            route_cost = (
+                current_cost + (distance << shift) + 1
+            )  # calculate the total distance and routes taken from the origin.
+            known_cost = cost[connected_station]
+            if known_cost is None or route_cost < known_cost:
+                cost[connected_station] = route_cost
+                push(unvisited_stations, route_cost << shift | connected_station)
+
+    dist = [None if c is None else c >> shift for c in cost]
+    hops = [0 if c is None else c & mask for c in cost]
+    return dist, hops
+
+
+def _bidirectional_dijkstra(
+    forward: list[dict[int, int]], backward: list[dict[int, int]], src: int, dst: int
+) -> Tuple[int | None, int]:
+    """Runs Dijkstra's algorithm forwards from src and backwards from dst until the searches meet.
+
+    forward and backward hold the routes leaving each station, keyed by destination id, for the
+    station map and for the station map with every route reversed. Each step expands whichever search has the nearer
+    station, and the search stops once no unexpanded station can lead to a shorter route. Ties
+    are broken on the fewest stops, the same as _dijkstra.
+
+    Returns:
+        A tuple of the distance from src to dst and the number of routes taken to get there.
+
+        The distance is None if no route exists.
+    """
+    n = len(forward)
+    shift = _route_shift(n)
+    mask = (1 << shift) - 1
+    push, pop = heappush, heappop  # bound locally, the same as in _dijkstra
+
+    searches = []
+    for graph, start in ((forward, src), (backward, dst)):
+        cost: list[int | None] = [None] * n
+        cost[start] = 0
+        searches.append((graph, cost, [start]))
+    forward_search, backward_search = searches
+    forward_heap, backward_heap = forward_search[2], backward_search[2]
+
+    best_cost: int | None = None
+
+    while forward_heap and backward_heap:
+        forward_top, backward_top = forward_heap[0] >> shift, backward_heap[0] >> shift
+        if best_cost is not None and forward_top + backward_top >= best_cost:
+            break  # neither search can improve on the best route found so far.
+
+        if forward_top <= backward_top:
+            routes, cost, heap = forward_search
+            other_cost = backward_search[1]
+        else:
+            routes, cost, heap = backward_search
+            other_cost = forward_search[1]
+
+        entry = pop(heap)
+        current_cost, current_station = entry >> shift, entry & mask
+        if current_cost != cost[current_station]:
+            continue  # a shorter route to this station has already been processed.
+
+        for connected_station, distance in routes[current_station].items():
+            route_cost = current_cost + (distance << shift) + 1
+            known_cost = cost[connected_station]
+            if known_cost is None or route_cost < known_cost:
+                cost[connected_station] = route_cost
+                push(heap, route_cost << shift | connected_station)
+
+                # the searches meet at this station, check whether the joined route is shorter.
+                joined_cost = other_cost[connected_station]
+                if joined_cost is not None:
+                    joined_cost += route_cost
+                    if best_cost is None or joined_cost < best_cost:
+                        best_cost = joined_cost
+
+    if best_cost is None:
+        return None, 0
+    return best_cost >> shift, best_cost & mask
+
+
 class StationMap:
     """Holds complete station map and calculates the shortest route."""
 
     def __init__(self):
         self.stations: dict[str, Station] = {}
-
-    def _add_station(self, station_name: str):
-        if station_name not in self.stations:
-            self.stations[station_name] = Station(station_name)
+        # Each station is assigned a contiguous integer id, in the same order as stations, so
+        # the route search can work on plain lists instead of dicts keyed by Station objects.
+        self.ids: dict[str, int] = {}
+        self._stations_by_id: list[Station] = []
+        # Station.routes of each station in id order, shared rather than copied, and the same
+        # with every route reversed which is built when first needed.
+        self._routes: list[dict[int, int]] = []
+        self._reverse_routes_cache: list[dict[int, int]] | None = None
+        # Shortest route trees already calculated, keyed by origin id.
+        self._sssp_cache: dict[int, Tuple[list[int | None], list[int]]] = {}
+        self._queried_origins: set[int] = set()
+        # Results of the bidirectional search, keyed by (origin id, destination id).
+        self._route_cache: dict[Tuple[int, int], Tuple[int | None, int]] = {}
+
+    def _add_station(self, station_name: str) -> int:
+        station_id = self.ids.get(station_name)
+        if station_id is None:
+            station_id = self.ids[station_name] = len(self.ids)
+            station = self.stations[station_name] = Station(station_name, station_id)
+            self._stations_by_id.append(station)
+            self._routes.append(station.routes)
+        return station_id
 
     def add_route(self, origin_name: str, destination_name: str, distance: int):
         """Adds a new route to the station map and adds new stations as necessary."""
-        self._add_station(origin_name)
-        self._add_station(destination_name)
-        self.stations[origin_name].add_route(self.stations[destination_name], distance)
-
-    @staticmethod
-    def _count_stops(
-        destination: Station, origin: Station, previous_stations: dict[Station, Station]
-    ) -> int:
-        # follow the path backwords and count the number of stops.
-        stops = 0
-        while previous_stations[destination] != origin:
-            destination = previous_stations[destination]
-            stops += 1
-        return stops
+        origin_id = self._add_station(origin_name)
+        destination_id = self._add_station(destination_name)
+        stations = self._stations_by_id
+        stations[origin_id].add_route(stations[destination_id], distance)
+
+        self._reverse_routes_cache = None
+        self._sssp_cache.clear()
+        self._queried_origins.clear()
+        self._route_cache.clear()
+
+    def _reverse_routes(self) -> list[dict[int, int]]:
+        """Routes of each station with every route reversed, used to search backwards from a destination.
+
+        Cached until the next route is added.
+        """
+        if self._reverse_routes_cache is None:
+            reverse_routes: list[dict[int, int]] = [{} for _ in self._routes]
+            for origin, station_routes in enumerate(self._routes):
+                for destination, distance in station_routes.items():
+                    reverse_routes[destination][origin] = distance
+            self._reverse_routes_cache = reverse_routes
+        return self._reverse_routes_cache
+
+    def _sssp(self, origin: int) -> Tuple[list[int | None], list[int]]:
+        """Finds the shortest routes from origin to every station it is connected to.
+
+        A single search already reaches every station so the whole tree is cached until the next
+        route is added.
+        """
+        if origin not in self._sssp_cache:
+            self._sssp_cache[origin] = _dijkstra(self._routes, origin)
+        return self._sssp_cache[origin]
 
     def find_shortest_route(
         self, origin_name: str, destination_name: str
     ) -> Tuple[int | float, int | None]:
         """Finds the shortest route between two stations.
 
-        Uses modified Dijkstra's algorithm to support stations that are not connected.
+        Uses modified Dijkstra's algorithm to support stations that are not connected. The first
+        query from an origin searches from both ends at once and its result is cached, queries for
+        other destinations from the same origin use its cached shortest route tree.
+        When routes tie on distance the one with the fewest stops is used.
 
         Args:
             origin: Name of origin station.
@@ -80,60 +245,38 @@ class StationMap:
         if origin_name == destination_name:
             return 0, 0
 
-        origin = self.stations[origin_name]
-        destination = self.stations[destination_name]
-
-        unvisited_stations: list[Tuple[int | float, Station]] = []
-        visited: set[
-            Station
-        ] = set()  # we have to track this separately in order to support unconnected
-        # stations which is also why we cant add all stations to unvisited stations at the start.
-        dist: dict[Station, int | float] = {}
-        prev: dict[Station, Station] = {}
-
-        for station in self.stations.values():
-            if station == origin:
-                dist[station] = 0
-            else:
-                # Unvisited stations start with infinite distance.
-                dist[station] = math.inf
-
-        heappush(
-            unvisited_stations, (0, origin)
-        )  # start at the origin station with distance 0
-
-        while len(unvisited_stations) > 0:
-            current_station = heappop(unvisited_stations)[
-                1
-            ]  # pop off the nearest unvisited station
-
-            if current_station == destination:
-                return dist[current_station], self._count_stops(
-                    current_station, origin, prev
-                )
-
-            for connected_station in current_station.routes:
-                if connected_station not in visited:
-                    route_total = (
-                        dist[current_station]
-                        + current_station.routes[connected_station]
-                    )  # calculate the total distance of this route from the origin.
-                    if route_total < dist[connected_station]:
-                        dist[connected_station] = route_total
-                        prev[connected_station] = current_station
-                        heappush(unvisited_stations, (route_total, connected_station))
-
-            visited.add(current_station)
-
-        return math.inf, None  # no route
+        origin = self.ids[origin_name]
+        destination = self.ids[destination_name]
+
+        if (origin, destination) in self._route_cache:
+            distance, routes = self._route_cache[origin, destination]
+        elif origin in self._queried_origins:
+            # a new destination from the same origin suggests more will follow so use the full
+            # route tree.
+            dist, hops = self._sssp(origin)
+            distance, routes = dist[destination], hops[destination]
+        else:
+            self._queried_origins.add(origin)
+            distance, routes = _bidirectional_dijkstra(
+                self._routes, self._reverse_routes(), origin, destination
+            )
+            self._route_cache[origin, destination] = distance, routes
+
+        if distance is None:
+            return math.inf, None  # no route
+
+        return distance, routes - 1  # every route but the last ends at a stop
 
 
 class Station:
     """A Train station and its connected routes."""
 
-    def __init__(self, name: str):
+    __slots__ = ("name", "id", "routes")
+
+    def __init__(self, name: str, station_id: int):
         self.name: str = name
-        self.routes: dict[Station, int] = {}
+        self.id: int = station_id
+        self.routes: dict[int, int] = {}  # distance keyed by destination station id
 
     def add_route(self, destination: Station, distance: int):
         """Adds a new route between this station and another.
@@ -141,16 +284,12 @@ class Station:
         Raises:
             DuplicateRouteError: Only one route for each direction between stations is allowed.
         """
-        if destination in self.routes:
+        if destination.id in self.routes:
             raise DuplicateRouteError(
                 f"Route from {self.name} to {destination.name} already exists."
             )
 
-        self.routes[destination] = distance
-
-    def __gt__(self, *args) -> bool:
-        # this method is required by heappush as a tie breaker when distances are equal.
-        return False
+        self.routes[destination.id] = distance
 
     def __repr__(self) -> str:
         return f"{{Station: {self.name}}}"
@@ -170,25 +309,33 @@ def parse_routes(path: str) -> StationMap:
 
     try:
         with open(path) as csvfile:
-            reader = csv.DictReader(
-                csvfile, fieldnames=["origin", "destination", "distance"]
-            )
+            reader = csv.reader(csvfile)
+            add_route = station_map.add_route
+            intern = sys.intern
 
             for row in reader:
-                try:
-                    distance = int(row["distance"])
-                except TypeError:
+                if not row:
+                    continue  # skip blank lines
+
+                if len(row) != 3:
                     raise RouteParsingError(
                         f"Invalid route format. Expected format: origin_name, destination_name, distance.",
                         reader.line_num,
                     )
+                origin, destination, distance_text = row
+                # station names repeat throughout the file, interning them means later dict
+                # lookups can match on identity before comparing strings.
+                origin, destination = intern(origin), intern(destination)
+
+                try:
+                    distance = int(distance_text)
                 except ValueError:
                     raise RouteParsingError(
-                        f"'{row['distance']}' is not an integer", reader.line_num
+                        f"'{distance_text}' is not an integer", reader.line_num
                     )
 
                 try:
-                    station_map.add_route(row["origin"], row["destination"], distance)
+                    add_route(origin, destination, distance)
                 except DuplicateRouteError as e:
                     raise RouteParsingError(
                         f"Route parsing failed: {e}", reader.line_num
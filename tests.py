@@ -24,11 +24,34 @@ class TestParseRoutes(TestCase):
             parse_routes("test_routes_invalid.csv")
         self.assertTrue("Invalid route format" in context.exception.message)
 
+    def test_extra_field(self):
+        with self.assertRaises(RouteParsingError) as context:
+            parse_routes("test_routes_extra_field.csv")
+        self.assertTrue("Invalid route format" in context.exception.message)
+        self.assertTrue("line 2" in context.exception.message)
+
+    def test_blank_lines_skipped(self):
+        station_map = parse_routes("test_routes_blank_line.csv")
+        self.assertEqual(len(station_map.stations), 3)
+        self.assertEqual(station_map.find_shortest_route("A", "C"), (10, 1))
+
     def test_duplicate_route(self):
         with self.assertRaises(RouteParsingError) as context:
             parse_routes("test_routes_duplicate_route.csv")
         self.assertTrue("already exists" in context.exception.message)
 
+    def test_large_distance(self):
+        station_map = parse_routes("test_routes_large_distance.csv")
+        self.assertEqual(station_map.stations["A"].routes, {1: 10000000000000000000})
+
+        distance, stops = station_map.find_shortest_route("A", "B")
+        self.assertEqual(distance, 10000000000000000000)
+        self.assertEqual(stops, 0)
+
+        distance, stops = station_map.find_shortest_route("B", "D")
+        self.assertEqual(distance, 2**63)
+        self.assertEqual(stops, 1)
+
 
 class TestStationMap(TestCase):
     def setUp(self):
@@ -69,3 +92,34 @@ class TestStationMap(TestCase):
         distance, stops = self.station_map.find_shortest_route("A", "A")
         self.assertEqual(distance, 0)
         self.assertEqual(stops, 0)
+
+    def test_new_route_replaces_cached_route(self):
+        distance, stops = self.station_map.find_shortest_route("A", "C")
+        self.assertEqual(distance, 10)
+
+        self.station_map.add_route("A", "C", 3)
+        distance, stops = self.station_map.find_shortest_route("A", "C")
+        self.assertEqual(distance, 3)
+        self.assertEqual(stops, 0)
+
+    def test_repeated_route_is_consistent(self):
+        first = self.station_map.find_shortest_route("F", "J")
+        second = self.station_map.find_shortest_route("F", "J")
+        self.assertEqual(first, (25, 1))
+        self.assertEqual(second, first)
+        self.assertEqual(self.station_map._sssp_cache, {})
+
+    def test_tied_routes_use_fewest_stops(self):
+        station_map = parse_routes("test_routes_tie.csv")
+        first = station_map.find_shortest_route("2", "3")
+        second = station_map.find_shortest_route("2", "3")
+        self.assertEqual(first, (7, 2))
+        self.assertEqual(second, first)
+
+    def test_station_name_str_subclass(self):
+        class Name(str):
+            pass
+
+        distance, stops = self.station_map.find_shortest_route(Name("A"), Name("C"))
+        self.assertEqual(distance, 10)
+        self.assertEqual(stops, 1)